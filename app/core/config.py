@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Mapping, Tuple
+import os
+
+# Using the frozen copy of .env from tools/freeze_env.py when it's been generated
+try:
+    from app.core.env_generated import ENV as FROZEN_ENV
+except ImportError:
+    FROZEN_ENV = None
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """My application settings, read from the environment once per process"""
+    DB_HOST: str
+    DB_PORT: str
+    DB_USER: str
+    DB_PASSWORD: str
+    DB_NAME: str
+    DB_POOL_SIZE: int
+    SECRET_KEY: str
+    ALGORITHM: str
+    ACCESS_TOKEN_EXPIRE_MINUTES: int
+    CORS_ORIGINS: Tuple[str, ...]
+    PORT: int
+    ENV: str
+    WEB_CONCURRENCY: int
+
+def _environment() -> Mapping[str, str]:
+    """
+    I'm returning the variables to read settings from.
+    Real environment variables always win over values from .env.
+    """
+    if FROZEN_ENV is not None:
+        # No .env parsing at all - the frozen values are just a module import
+        return {**FROZEN_ENV, **os.environ}
+    
+    # Only importing python-dotenv when there's no frozen copy to use
+    from dotenv import load_dotenv
+    load_dotenv(override=False)
+    return os.environ
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    I'm loading the environment and reading every setting exactly once.
+    Everything else calls this instead of os.getenv, so .env is parsed
+    at most once per process no matter how many modules need configuration.
+    """
+    env = _environment()
+    
+    return Settings(
+        DB_HOST=env.get("DB_HOST", "localhost"),
+        DB_PORT=env.get("DB_PORT", "3306"),
+        DB_USER=env.get("DB_USER", "root"),
+        DB_PASSWORD=env.get("DB_PASSWORD", ""),
+        DB_NAME=env.get("DB_NAME", "finance_tracker"),
+        # mysql.connector opens every pooled connection up front, so I keep this small
+        DB_POOL_SIZE=int(env.get("DB_POOL_SIZE", "2")),
+        SECRET_KEY=env.get("SECRET_KEY", "your-secret-key-here-change-this-in-production"),
+        ALGORITHM=env.get("ALGORITHM", "HS256"),
+        ACCESS_TOKEN_EXPIRE_MINUTES=int(env.get("ACCESS_TOKEN_EXPIRE_MINUTES", "30")),
+        # Comma-separated list - leaving it unset keeps the open "*" policy for local development
+        CORS_ORIGINS=tuple(
+            origin.strip() for origin in env.get("CORS_ORIGINS", "*").split(",") if origin.strip()
+        ),
+        PORT=int(env.get("PORT", "8000")),
+        ENV=env.get("ENV", "dev"),
+        WEB_CONCURRENCY=int(env.get("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+    )
@@ -0,0 +1,63 @@
+from contextlib import closing
+from functools import lru_cache
+from mysql.connector import pooling
+import re
+
+from app.core.config import get_settings
+
+# Identifiers can't be sent as query parameters, so I only ever interpolate
+# names that match this whitelist (MySQL allows up to 64 characters)
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,63}")
+
+def validate_identifier(name: str) -> str:
+    """
+    I'm checking a database/table name before it goes into a SQL string.
+    Returns the name unchanged, or raises ValueError if it isn't a plain identifier.
+    """
+    if not _IDENTIFIER.fullmatch(name):
+        raise ValueError(f"Invalid MySQL identifier: {name!r}")
+    return name
+
+@lru_cache(maxsize=1)
+def get_connection_pool() -> pooling.MySQLConnectionPool:
+    """
+    I'm creating one server-level MySQL connection pool for my setup scripts.
+    It isn't bound to a database because the database may not exist yet.
+    mysql.connector opens every pooled connection up front, so I keep the
+    default size small - set DB_POOL_SIZE to raise it.
+    mysql.connector already uses its C extension when it's installed and
+    falls back to pure Python otherwise, so I don't force either one.
+    """
+    settings = get_settings()
+    return pooling.MySQLConnectionPool(
+        pool_name="finance",
+        pool_size=settings.DB_POOL_SIZE,
+        host=settings.DB_HOST,
+        port=int(settings.DB_PORT),
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        autocommit=True,     # My setup statements are all DDL or reads - no transactions to manage
+        charset="utf8mb4"    # Matching the charset my app engine negotiates
+    )
+
+@lru_cache(maxsize=None)
+def ensure_database(name: str) -> bool:
+    """
+    I'm making sure the database exists, creating it only if it's missing.
+    Returns True if I created it just now, False if it was already there.
+    The result is cached, so repeated calls in one process cost nothing.
+    """
+    db_name = validate_identifier(name)
+    # closing() hands the connection back to the pool even if a statement fails
+    with closing(get_connection_pool().get_connection()) as connection:
+        with closing(connection.cursor(prepared=True)) as cursor:
+            cursor.execute(
+                "SELECT SCHEMA_NAME FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = %s LIMIT 1",
+                (db_name,)
+            )
+            if cursor.fetchone() is not None:
+                return False
+        
+        with closing(connection.cursor()) as cursor:
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+        return True
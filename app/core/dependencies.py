@@ -1,6 +1,9 @@
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from cachetools import TTLCache
+import threading
 from app.core.database import get_db
 from app.core.security import verify_token
 from app.models.models import User
@@ -8,6 +11,55 @@ from app.models.models import User
 # Setting up OAuth2 scheme - this will look for tokens in the Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
+# Caching user rows by username so authenticated bursts skip the users SELECT
+# I'm storing plain dicts (never ORM instances) so nothing is bound to an old session
+# Each worker process has its own cache, so invalidate_cached_user only clears the
+# worker that served the change - others can serve a changed or deleted user for
+# up to the TTL. Routes that write rows for the user go through get_persistent_user
+_user_cache = TTLCache(maxsize=5000, ttl=30)
+_user_cache_lock = threading.Lock()
+
+# These are the only columns I need to rebuild the current user
+_CACHED_USER_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.full_name,
+    User.is_active,
+    User.created_at,
+)
+
+def _load_user_data(db: Session, username: str):
+    """
+    I'm loading the cached columns for a user, or None if they don't exist.
+    This is blocking DB I/O, so callers on the event loop must offload it.
+    """
+    row = db.query(*_CACHED_USER_COLUMNS).filter(User.username == username).first()
+    return dict(row._mapping) if row is not None else None
+
+def invalidate_cached_user(username: str) -> None:
+    """
+    I'm dropping a user from the cache after their profile changes or is deleted.
+    """
+    with _user_cache_lock:
+        _user_cache.pop(username, None)
+
+def get_persistent_user(db: Session, current_user: User) -> User:
+    """
+    I'm loading the current user's row before a write that depends on it.
+    The cached copy can outlive the account on other workers, so a deleted
+    user gets a 401 here instead of a foreign key error on insert.
+    """
+    user = db.get(User, current_user.id)
+    if user is None:
+        invalidate_cached_user(current_user.username)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -15,6 +67,8 @@ async def get_current_user(
     """
     I'm getting the current user from the JWT token.
     This will be used as a dependency in protected routes.
+    The returned User is transient - routes that change the user must
+    write through their session rather than mutate this object.
     """
     # Creating the exception I'll raise if credentials are invalid
     credentials_exception = HTTPException(
@@ -24,15 +78,24 @@ async def get_current_user(
     )
     
     # Verifying the token and getting the username
+    # This is pure CPU work (plus a cache lookup), so it's fine on the event loop
     username = verify_token(token, credentials_exception)
     
-    # Finding the user in the database
-    user = db.query(User).filter(User.username == username).first()
+    # Checking the cache before going to the database
+    with _user_cache_lock:
+        user_data = _user_cache.get(username)
     
-    if user is None:
-        raise credentials_exception
+    if user_data is None:
+        # Finding the user in the database - in the threadpool so the event loop isn't blocked
+        user_data = await run_in_threadpool(_load_user_data, db, username)
         
-    return user
+        if user_data is None:
+            raise credentials_exception
+        
+        with _user_cache_lock:
+            _user_cache[username] = user_data
+        
+    return User(**user_data)
 
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
@@ -43,4 +106,4 @@ async def get_current_active_user(
     """
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
\ No newline at end of file
+    return current_user
@@ -1,21 +1,41 @@
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from typing import Optional, Tuple
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
-import os
-from dotenv import load_dotenv
+from cachetools import TTLCache
+import hashlib
+import threading
+import time
 
-# Loading my environment variables
-load_dotenv()
+from app.core.config import get_settings
 
-# Getting my security settings from environment
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here-change-this-in-production")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# Getting my security settings
+settings = get_settings()
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+
+# Building the signing key once - passing the raw secret makes python-jose
+# re-parse and re-construct the key on every encode/decode
+_JWT_KEY = jwk.construct(SECRET_KEY, algorithm=ALGORITHM)
+
+# Caching verified tokens for a few seconds so repeat requests skip jwt.decode
+# I'm keying by a SHA-256 digest so raw tokens never sit in memory as keys
+TOKEN_CACHE_TTL_SECONDS = 5
+_token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()  # TTLCache isn't thread-safe on its own
 
 # Setting up password hashing context
-# I'm using bcrypt for secure password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# I'm using argon2id for new hashes - it's far cheaper per login than 12-round bcrypt
+# bcrypt stays listed (and deprecated) so existing hashes still verify and get upgraded
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,  # 19 MiB
+    argon2__parallelism=1,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -24,6 +44,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    I'm verifying a password and, if its hash uses a deprecated scheme,
+    returning a fresh argon2 hash to store in its place.
+    Returns (verified, new_hash) where new_hash is None when no upgrade is needed.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     """
     I'm creating a hash from a plain password.
@@ -49,25 +77,50 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode.update({"exp": expire})
     
     # Creating the actual JWT token
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str, credentials_exception):
     """
     I'm verifying and decoding a JWT token.
     If invalid, I'll raise the provided exception.
+    Recently verified tokens are served from a short-lived cache.
     """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    
+    # Checking the cache first - entries never outlive the token's own expiry
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            username, expires_at = cached
+            if now < expires_at:
+                return username
+            del _token_cache[key]
+    
     try:
         # Decoding the token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")  # "sub" is standard JWT claim for subject
         
         if username is None:
             raise credentials_exception
-            
-        return username
     except JWTError:
         raise credentials_exception
+    
+    # jwt.decode already rejected expired tokens, but I'm still checking exp
+    # myself so the cached entry can be capped at the token's expiry
+    exp = payload.get("exp")
+    if exp is not None and exp <= now:
+        raise credentials_exception
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    if exp is not None:
+        expires_at = min(exp, expires_at)
+    
+    with _token_cache_lock:
+        _token_cache[key] = (username, expires_at)
+    
+    return username
 
 def create_reset_password_token(email: str) -> str:
     """
@@ -83,7 +136,7 @@ def verify_reset_token(token: str) -> Optional[str]:
     I'm verifying a password reset token and returning the email if valid.
     """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=[ALGORITHM])
         if payload.get("type") != "password_reset":
             return None
         return payload.get("sub")
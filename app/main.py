@@ -2,9 +2,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
-import os
+import anyio
 
 from app.routers import auth
+from app.core.config import get_settings
 from app.core.database import engine, Base
 
 # Creating all database tables
@@ -17,11 +18,15 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Reading allowed origins from my settings (CORS_ORIGINS in the environment)
+CORS_ORIGINS = list(get_settings().CORS_ORIGINS)
+
 # Setting up CORS middleware for frontend communication
+# Browsers reject credentials with a wildcard origin, so I only allow them for explicit origins
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # I'll restrict this in production
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials="*" not in CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -32,13 +37,9 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Including my routers
 app.include_router(auth.router)
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """
-    I'm serving a simple welcome page at the root.
-    The actual app will be served from here later.
-    """
-    return """
+# My welcome page never changes, so I'm encoding it once at import
+# instead of rebuilding and re-encoding the string on every request
+_ROOT_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -86,6 +87,18 @@ async def root():
     </body>
     </html>
     """
+_ROOT_HTML_BYTES = _ROOT_HTML.encode("utf-8")
+
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    """
+    I'm serving a simple welcome page at the root.
+    The actual app will be served from here later.
+    """
+    return HTMLResponse(
+        content=_ROOT_HTML_BYTES,
+        headers={"cache-control": "public, max-age=3600"}
+    )
 
 @app.get("/health")
 async def health_check():
@@ -104,6 +117,9 @@ async def startup_event():
     I'm running this when the application starts.
     Good place for initialization tasks.
     """
+    # My DB routes are plain def, so FastAPI runs them in the anyio threadpool
+    # Raising the default limit of 40 threads so a few slow queries can't starve every other request
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
     print("AI Expense Tracker is starting up...")
     print("Database tables created/verified")
     print("Ready to track expenses!")
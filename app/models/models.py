@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, CheckConstraint, Index, Boolean, text
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 from datetime import datetime
@@ -15,6 +15,12 @@ class ExpenseCategory(str, enum.Enum):
     EDUCATION = "education"
     OTHER = "other"
 
+# I'm storing categories as plain strings so rows load without per-value enum coercion
+# The database still enforces the allowed values through this CHECK constraint
+CATEGORY_CHECK = "category IN ({})".format(
+    ", ".join(f"'{category.value}'" for category in ExpenseCategory)
+)
+
 class User(Base):
     """My User model for authentication and linking expenses to users"""
     __tablename__ = "users"
@@ -24,7 +30,9 @@ class User(Base):
     username = Column(String(50), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(100))
-    is_active = Column(Integer, default=1)  # Using Integer since MySQL doesn't have native boolean
+    # MySQL stores this as TINYINT(1); the Python default keeps inserts working on
+    # older tables where is_active has no database default
+    is_active = Column(Boolean, nullable=False, default=True, server_default=text("1"))
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Setting up relationship - one user can have many expenses
@@ -33,11 +41,14 @@ class User(Base):
 class Expense(Base):
     """My Expense model for tracking individual expenses"""
     __tablename__ = "expenses"
+    __table_args__ = (
+        CheckConstraint(CATEGORY_CHECK, name="ck_expenses_category"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     amount = Column(Float, nullable=False)
-    category = Column(Enum(ExpenseCategory), nullable=False)
+    category = Column(String(20), nullable=False)
     description = Column(Text)
     date = Column(DateTime, default=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -47,19 +58,31 @@ class Expense(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Creating the relationship back to user
-    owner = relationship("User", back_populates="expenses")
+    # No route needs the owner row, so I'm making any lazy load raise instead of
+    # silently issuing one SELECT per expense - use selectinload() if it's ever needed
+    owner = relationship("User", back_populates="expenses", lazy="raise_on_sql")
     
     # Adding AI fields for when I implement AI categorization
     ai_confidence = Column(Float)  # I'll store how confident the AI was
     ai_suggested_category = Column(String(50))  # I'll store what the AI suggested
 
+# Covering the dominant query shape: one user's expenses filtered/sorted by date
+# The user_id prefix also serves the foreign key, so MySQL doesn't need a separate index
+Index("ix_expenses_user_date", Expense.user_id, Expense.date.desc())
+
+# Covering category-filtered lists and the per-category statistics
+Index("ix_expenses_user_cat_date", Expense.user_id, Expense.category, Expense.date)
+
 class Budget(Base):
     """My Budget model for setting spending limits per category"""
     __tablename__ = "budgets"
+    __table_args__ = (
+        CheckConstraint(CATEGORY_CHECK, name="ck_budgets_category"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    category = Column(Enum(ExpenseCategory), nullable=False)
+    category = Column(String(20), nullable=False)
     amount = Column(Float, nullable=False)
     period = Column(String(20), default="monthly")  # I'll support monthly, weekly, yearly
     created_at = Column(DateTime, default=datetime.utcnow)
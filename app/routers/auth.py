@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from typing import Optional
@@ -7,11 +8,11 @@ from typing import Optional
 from app.core.database import get_db
 from app.core.security import (
     get_password_hash, 
-    verify_password, 
+    verify_and_update_password, 
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
-from app.core.dependencies import get_current_active_user
+from app.core.dependencies import get_current_active_user, get_persistent_user, invalidate_cached_user
 from app.models.models import User
 from app.schemas.schemas import (
     UserCreate, 
@@ -28,25 +29,23 @@ router = APIRouter(
 )
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """
     I'm creating a new user account.
     This checks for existing email/username and hashes the password.
     """
-    # Checking if email already exists
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
+    # Checking email and username in one round-trip
+    # I'm fetching up to two rows since each field could collide with a different user
+    existing = db.query(User.email, User.username).filter(
+        or_(User.email == user_data.email, User.username == user_data.username)
+    ).limit(2).all()
     
-    # Checking if username already exists
-    existing_username = db.query(User).filter(User.username == user_data.username).first()
-    if existing_username:
+    if existing:
+        # MySQL compares case-insensitively, so I'm doing the same here
+        email_taken = any(row.email.lower() == user_data.email.lower() for row in existing)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already taken"
+            detail="Email already registered" if email_taken else "Username already taken"
         )
     
     # Creating new user with hashed password
@@ -66,7 +65,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     return new_user
 
 @router.post("/login", response_model=Token)
-async def login(
+def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -75,20 +74,34 @@ async def login(
     Users can login with either username or email.
     Returns a JWT token on successful authentication.
     """
-    # Trying to find user by username first, then by email
-    user = db.query(User).filter(User.username == form_data.username).first()
-    if not user:
-        # Maybe they used email instead of username
-        user = db.query(User).filter(User.email == form_data.username).first()
+    # Looking the user up by username or email in one query
+    # Two different users could match (one by username, one by email), so I'm
+    # fetching up to two rows and still preferring the username match
+    candidates = db.query(User).filter(
+        or_(User.username == form_data.username, User.email == form_data.username)
+    ).limit(2).all()
+    user = next(
+        (c for c in candidates if c.username.lower() == form_data.username.lower()),
+        candidates[0] if candidates else None
+    )
     
     # Checking if user exists and password is correct
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = (
+        verify_and_update_password(form_data.password, user.hashed_password)
+        if user else (False, None)
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username/email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Upgrading legacy bcrypt hashes to argon2 now that I have the plain password
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
+    
     # Checking if user is active
     if not user.is_active:
         raise HTTPException(
@@ -116,7 +129,7 @@ async def get_current_user_profile(
     return current_user
 
 @router.put("/me", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     user_update: UserUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -125,37 +138,55 @@ async def update_profile(
     I'm updating the current user's profile.
     All fields are optional.
     """
-    # Checking if new email is already taken (if email is being updated)
-    if user_update.email and user_update.email != current_user.email:
-        existing = db.query(User).filter(User.email == user_update.email).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already in use"
-            )
+    # Making sure the account still exists - the auth cache can lag a deletion on another worker
+    get_persistent_user(db, current_user)
+    
+    # Checking if a new email/username is already taken, in a single query
+    email_changed = bool(user_update.email) and user_update.email != current_user.email
+    username_changed = bool(user_update.username) and user_update.username != current_user.username
     
-    # Checking if new username is already taken (if username is being updated)
-    if user_update.username and user_update.username != current_user.username:
-        existing = db.query(User).filter(User.username == user_update.username).first()
+    conditions = []
+    if email_changed:
+        conditions.append(User.email == user_update.email)
+    if username_changed:
+        conditions.append(User.username == user_update.username)
+    
+    if conditions:
+        existing = db.query(User.email, User.username).filter(
+            or_(*conditions)
+        ).limit(2).all()
+        
         if existing:
+            email_taken = email_changed and any(
+                row.email.lower() == user_update.email.lower() for row in existing
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
+                detail="Email already in use" if email_taken or not username_changed else "Username already taken"
             )
     
-    # Updating user fields
+    # Collecting only the fields that actually change
+    changes = {}
     if user_update.email:
-        current_user.email = user_update.email
+        changes["email"] = user_update.email
     if user_update.username:
-        current_user.username = user_update.username
+        changes["username"] = user_update.username
     if user_update.full_name:
-        current_user.full_name = user_update.full_name
+        changes["full_name"] = user_update.full_name
     if user_update.password:
-        current_user.hashed_password = get_password_hash(user_update.password)
+        changes["hashed_password"] = get_password_hash(user_update.password)
     
-    # Saving changes
-    db.commit()
-    db.refresh(current_user)
+    if changes:
+        # Saving changes with one UPDATE - no SELECT to load the row, no refresh after
+        db.execute(update(User).where(User.id == current_user.id).values(**changes))
+        db.commit()
+        invalidate_cached_user(current_user.username)
+        
+        # current_user is a transient copy from the auth cache, so I'm patching it
+        # directly for the response instead of reloading it
+        changes.pop("hashed_password", None)
+        for field, value in changes.items():
+            setattr(current_user, field, value)
     
     return current_user
 
@@ -169,7 +200,7 @@ async def logout():
     return {"message": "Successfully logged out"}
 
 @router.delete("/me")
-async def delete_account(
+def delete_account(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -177,7 +208,10 @@ async def delete_account(
     I'm allowing users to delete their own account.
     This will also delete all their expenses (cascade delete).
     """
-    db.delete(current_user)
+    # Loading the persistent row so the cascade to expenses still runs
+    user = get_persistent_user(db, current_user)
+    db.delete(user)
     db.commit()
+    invalidate_cached_user(current_user.username)
     
     return {"message": "Account deleted successfully"}
\ No newline at end of file
@@ -1,15 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 from typing import List, Optional
 from datetime import datetime, timedelta
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_active_user
+from app.core.dependencies import get_current_active_user, get_persistent_user
 from app.models.models import User, Expense, ExpenseCategory
 from app.schemas.schemas import (
     ExpenseCreate, 
     ExpenseUpdate, 
     ExpenseResponse,
+    ExpenseListResponse,
     ExpenseStatistics
 )
 
@@ -19,8 +21,21 @@ router = APIRouter(
     tags=["Expenses"]
 )
 
+# List endpoints only load the columns ExpenseListResponse needs
+# This keeps the TEXT description and AI fields off the wire
+LIST_COLUMNS = load_only(
+    Expense.id,
+    Expense.title,
+    Expense.amount,
+    Expense.category,
+    Expense.date,
+    Expense.user_id,
+    Expense.created_at,
+    Expense.updated_at
+)
+
 @router.post("/", response_model=ExpenseResponse, status_code=status.HTTP_201_CREATED)
-async def create_expense(
+def create_expense(
     expense_data: ExpenseCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -28,20 +43,31 @@ async def create_expense(
     """
     I'm creating a new expense for the authenticated user.
     """
+    # Making sure the account still exists - the auth cache can lag a deletion on another worker
+    get_persistent_user(db, current_user)
+    
+    # Filling the timestamps client-side so the object is complete after the INSERT
+    # and I don't need a refresh SELECT (MySQL has no INSERT ... RETURNING)
+    now = datetime.utcnow()
+    expense_fields = expense_data.dict()
+    if expense_fields["date"] is None:
+        expense_fields["date"] = now
+    
     # Creating expense with the current user as owner
     new_expense = Expense(
-        **expense_data.dict(),
-        user_id=current_user.id
+        **expense_fields,
+        user_id=current_user.id,
+        created_at=now,
+        updated_at=now
     )
     
     db.add(new_expense)
-    db.commit()
-    db.refresh(new_expense)
+    db.commit()  # The generated id comes back with the INSERT itself
     
     return new_expense
 
-@router.get("/", response_model=List[ExpenseResponse])
-async def get_expenses(
+@router.get("/", response_model=List[ExpenseListResponse])
+def get_expenses(
     skip: int = Query(0, ge=0),  # For pagination
     limit: int = Query(100, ge=1, le=100),  # Max 100 items per page
     category: Optional[ExpenseCategory] = None,
@@ -54,11 +80,11 @@ async def get_expenses(
     I'm getting all expenses for the current user with optional filters.
     """
     # Starting with base query
-    query = db.query(Expense).filter(Expense.user_id == current_user.id)
+    query = db.query(Expense).options(LIST_COLUMNS).filter(Expense.user_id == current_user.id)
     
     # Applying filters if provided
     if category:
-        query = query.filter(Expense.category == category)
+        query = query.filter(Expense.category == category.value)
     
     if start_date:
         query = query.filter(Expense.date >= start_date)
@@ -72,7 +98,7 @@ async def get_expenses(
     return expenses
 
 @router.get("/statistics", response_model=ExpenseStatistics)
-async def get_expense_statistics(
+def get_expense_statistics(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     current_user: User = Depends(get_current_active_user),
@@ -81,8 +107,12 @@ async def get_expense_statistics(
     """
     I'm calculating statistics for the user's expenses.
     """
-    # Building base query
-    query = db.query(Expense).filter(Expense.user_id == current_user.id)
+    # Letting MySQL do the aggregation - one row per category instead of every expense
+    query = db.query(
+        Expense.category,
+        func.sum(Expense.amount),
+        func.count(Expense.id)
+    ).filter(Expense.user_id == current_user.id)
     
     # Applying date filters
     if start_date:
@@ -90,27 +120,12 @@ async def get_expense_statistics(
     if end_date:
         query = query.filter(Expense.date <= end_date)
     
-    expenses = query.all()
-    
-    # Calculating statistics
-    if not expenses:
-        return ExpenseStatistics(
-            total_expenses=0,
-            expense_count=0,
-            average_expense=0,
-            by_category={}
-        )
-    
-    total = sum(e.amount for e in expenses)
-    count = len(expenses)
+    rows = query.group_by(Expense.category).all()
     
-    # Grouping by category
-    by_category = {}
-    for expense in expenses:
-        category = expense.category.value
-        if category not in by_category:
-            by_category[category] = 0
-        by_category[category] += expense.amount
+    # Calculating statistics from the per-category totals
+    by_category = {category: float(total) for category, total, _ in rows}
+    total = sum(by_category.values())
+    count = sum(category_count for _, _, category_count in rows)
     
     return ExpenseStatistics(
         total_expenses=total,
@@ -120,7 +135,7 @@ async def get_expense_statistics(
     )
 
 @router.get("/{expense_id}", response_model=ExpenseResponse)
-async def get_expense(
+def get_expense(
     expense_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -128,12 +143,11 @@ async def get_expense(
     """
     I'm getting a specific expense by ID.
     """
-    expense = db.query(Expense).filter(
-        Expense.id == expense_id,
-        Expense.user_id == current_user.id  # Ensuring user owns this expense
-    ).first()
+    # Looking up by primary key so the session's identity map can answer it
+    expense = db.get(Expense, expense_id)
     
-    if not expense:
+    # Ensuring user owns this expense - same 404 either way so IDs can't be probed
+    if expense is None or expense.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Expense not found"
@@ -142,7 +156,7 @@ async def get_expense(
     return expense
 
 @router.put("/{expense_id}", response_model=ExpenseResponse)
-async def update_expense(
+def update_expense(
     expense_id: int,
     expense_update: ExpenseUpdate,
     current_user: User = Depends(get_current_active_user),
@@ -152,12 +166,9 @@ async def update_expense(
     I'm updating an existing expense.
     """
     # Finding the expense
-    expense = db.query(Expense).filter(
-        Expense.id == expense_id,
-        Expense.user_id == current_user.id
-    ).first()
+    expense = db.get(Expense, expense_id)
     
-    if not expense:
+    if expense is None or expense.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Expense not found"
@@ -177,7 +188,7 @@ async def update_expense(
     return expense
 
 @router.delete("/{expense_id}")
-async def delete_expense(
+def delete_expense(
     expense_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
@@ -185,12 +196,9 @@ async def delete_expense(
     """
     I'm deleting an expense.
     """
-    expense = db.query(Expense).filter(
-        Expense.id == expense_id,
-        Expense.user_id == current_user.id
-    ).first()
+    expense = db.get(Expense, expense_id)
     
-    if not expense:
+    if expense is None or expense.user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Expense not found"
@@ -201,8 +209,8 @@ async def delete_expense(
     
     return {"message": "Expense deleted successfully"}
 
-@router.get("/recent/week", response_model=List[ExpenseResponse])
-async def get_week_expenses(
+@router.get("/recent/week", response_model=List[ExpenseListResponse])
+def get_week_expenses(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -211,15 +219,15 @@ async def get_week_expenses(
     """
     week_ago = datetime.utcnow() - timedelta(days=7)
     
-    expenses = db.query(Expense).filter(
+    expenses = db.query(Expense).options(LIST_COLUMNS).filter(
         Expense.user_id == current_user.id,
         Expense.date >= week_ago
     ).order_by(Expense.date.desc()).all()
     
     return expenses
 
-@router.get("/recent/month", response_model=List[ExpenseResponse])
-async def get_month_expenses(
+@router.get("/recent/month", response_model=List[ExpenseListResponse])
+def get_month_expenses(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -228,7 +236,7 @@ async def get_month_expenses(
     """
     month_ago = datetime.utcnow() - timedelta(days=30)
     
-    expenses = db.query(Expense).filter(
+    expenses = db.query(Expense).options(LIST_COLUMNS).filter(
         Expense.user_id == current_user.id,
         Expense.date >= month_ago
     ).order_by(Expense.date.desc()).all()
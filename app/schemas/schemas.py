@@ -35,7 +35,7 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     """Schema for returning user data - never includes password"""
     id: int
-    is_active: int
+    is_active: bool
     created_at: datetime
     
     class Config:
@@ -49,6 +49,9 @@ class ExpenseBase(BaseModel):
     category: ExpenseCategory
     description: Optional[str] = None
     date: Optional[datetime] = None
+    
+    class Config:
+        use_enum_values = True  # Categories are stored as plain strings in the database
 
 class ExpenseCreate(ExpenseBase):
     """Schema for creating a new expense"""
@@ -61,6 +64,9 @@ class ExpenseUpdate(BaseModel):
     category: Optional[ExpenseCategory] = None
     description: Optional[str] = None
     date: Optional[datetime] = None
+    
+    class Config:
+        use_enum_values = True  # Categories are stored as plain strings in the database
 
 class ExpenseResponse(ExpenseBase):
     """Schema for returning expense data"""
@@ -74,12 +80,30 @@ class ExpenseResponse(ExpenseBase):
     class Config:
         from_attributes = True
 
+class ExpenseListResponse(BaseModel):
+    """Schema for expense lists - leaves out description and AI fields"""
+    id: int
+    title: str
+    amount: float
+    category: ExpenseCategory
+    date: Optional[datetime] = None
+    user_id: int
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+        use_enum_values = True
+
 # Budget schemas
 class BudgetBase(BaseModel):
     """Base schema for budget"""
     category: ExpenseCategory
     amount: float = Field(..., gt=0)
     period: str = Field(default="monthly", pattern="^(monthly|weekly|yearly)$")
+    
+    class Config:
+        use_enum_values = True  # Categories are stored as plain strings in the database
 
 class BudgetCreate(BudgetBase):
     """Schema for creating a budget"""
@@ -90,6 +114,9 @@ class BudgetUpdate(BaseModel):
     category: Optional[ExpenseCategory] = None
     amount: Optional[float] = Field(None, gt=0)
     period: Optional[str] = Field(None, pattern="^(monthly|weekly|yearly)$")
+    
+    class Config:
+        use_enum_values = True  # Categories are stored as plain strings in the database
 
 class BudgetResponse(BudgetBase):
     """Schema for returning budget data"""
@@ -1,9 +1,7 @@
 import mysql.connector
-import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from app.core.config import get_settings
+from app.core.db_bootstrap import ensure_database
 
 def create_finance_database():
     """Create the finance_tracker database in MySQL"""
@@ -11,36 +9,19 @@ def create_finance_database():
     print("Creating the finance_tracker database...")
     
     try:
-        # Connect to MySQL server using environment variables
-        connection = mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD')  # Now pulled from .env file
-        )
+        # Create the database (only if it doesn't exist yet)
+        db_name = get_settings().DB_NAME
+        if ensure_database(db_name):
+            print(f"Database '{db_name}' created successfully!")
+        else:
+            print(f"Database '{db_name}' already exists")
         
-        cursor = connection.cursor()
-        
-        # Create the database
-        db_name = os.getenv('DB_NAME', 'finance_tracker')
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
-        print(f"Database '{db_name}' created successfully!")
-        
-        # Show that it exists
-        cursor.execute("SHOW DATABASES")
-        databases = cursor.fetchall()
-        
-        print("\nAvailable databases:")
-        for db in databases:
-            if db[0] == db_name:
-                print(f"  > {db[0]} (your expense tracker database)")
-            else:
-                print(f"  - {db[0]}")
-            
-        cursor.close()
-        connection.close()
+        # ensure_database already confirmed it with a one-row catalog probe,
+        # so there's no need to list every database on the server
+        print(f"\n  > {db_name} (your expense tracker database)")
         return True
         
-    except mysql.connector.Error as err:
+    except (mysql.connector.Error, ValueError) as err:
         print(f"Error: {err}")
         return False
 
@@ -1,68 +1,216 @@
-from app.core.database import engine, Base
-from app.models.models import User, Expense, Budget  # Importing my models to register them
-import mysql.connector
-from dotenv import load_dotenv
-import os
+from app.core.config import get_settings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from importlib.util import find_spec
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+import hashlib
+import sys
 
-# Loading environment variables
-load_dotenv()
+# I'm recording a successful run here so repeat runs can skip all the database work
+# Delete this file to force a full re-initialization
+MARKER_FILE = Path(__file__).resolve().parent / ".db_initialized"
+
+def schema_fingerprint(settings) -> str:
+    """
+    I'm hashing my models source together with the target database.
+    Changing a model or pointing at another database produces a new fingerprint.
+    """
+    # Reading the source file directly so I don't have to import the models (and the engine)
+    models_source = Path(find_spec("app.models.models").origin).read_bytes()
+    digest = hashlib.sha256(models_source)
+    digest.update(f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}".encode())
+    return digest.hexdigest()
+
+def find_tables(db_name: str, expected: list) -> set:
+    """
+    I'm returning which of the expected tables exist.
+    I only ask the catalog about my own tables instead of listing every table in the schema.
+    If the account can't read information_schema (restricted grants), I fall back
+    to one SHOW TABLES ... LIKE probe per table, which only needs privileges on
+    the database itself.
+    """
+    from mysql.connector import Error as MySQLError
+    from app.core.db_bootstrap import get_connection_pool, validate_identifier
+    
+    # closing() returns the connection to the pool and closes the cursor even on errors
+    with closing(get_connection_pool().get_connection()) as connection:
+        # My catalog queries are fully parameterized, so they go through a
+        # server-side prepared statement cursor
+        try:
+            with closing(connection.cursor(prepared=True)) as cursor:
+                placeholders = ", ".join(["%s"] * len(expected))
+                cursor.execute(
+                    "SELECT TABLE_NAME FROM information_schema.TABLES "
+                    f"WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders})",
+                    (db_name, *expected)
+                )
+                found = {row[0] for row in cursor.fetchall()}
+            if found == set(expected):
+                return found
+        except MySQLError:
+            pass
+        
+        # The catalog errored or came back short - probing each of my tables directly on
+        # the same connection. Each probe returns at most one row, so buffering is free
+        found = set()
+        with closing(connection.cursor(buffered=True)) as cursor:
+            for table in expected:
+                # Escaping "_" so LIKE matches the name exactly instead of as a wildcard
+                cursor.execute(
+                    f"SHOW TABLES FROM `{validate_identifier(db_name)}` LIKE %s",
+                    (validate_identifier(table).replace("_", "\\_"),)
+                )
+                if cursor.fetchone() is not None:
+                    found.add(table)
+        return found
+
+def describe_tables_from_catalog(db_name: str) -> list:
+    """
+    I'm returning a formatted structure block for every table in the database.
+    One information_schema query covers every table instead of a DESCRIBE per table.
+    """
+    from app.core.db_bootstrap import get_connection_pool
+    
+    # The cursor is unbuffered, so rows stream in rather than being held in memory
+    with closing(get_connection_pool().get_connection()) as connection, \
+            closing(connection.cursor(prepared=True)) as cursor:
+        cursor.execute(
+            "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = %s ORDER BY TABLE_NAME, ORDINAL_POSITION",
+            (db_name,)
+        )
+        blocks = []
+        for table_name, columns in groupby(cursor, key=itemgetter(0)):
+            lines = [f"\nStructure of {table_name}:"]
+            lines.extend(f"  - {column_name}: {column_type}" for _, column_name, column_type in columns)
+            blocks.append("\n".join(lines) + "\n")
+        return blocks
+
+def describe_table(db_name: str, table: str) -> str:
+    """
+    I'm running DESCRIBE for one table on its own pooled connection.
+    Returns the formatted structure block.
+    """
+    from app.core.db_bootstrap import get_connection_pool, validate_identifier
+    
+    with closing(get_connection_pool().get_connection()) as connection, \
+            closing(connection.cursor()) as cursor:
+        cursor.execute(f"DESCRIBE `{validate_identifier(db_name)}`.`{validate_identifier(table)}`")
+        lines = [f"\nStructure of {table}:"]
+        lines.extend(f"  - {column[0]}: {column[1]}" for column in cursor.fetchall())
+        return "\n".join(lines) + "\n"
+
+def describe_tables(db_name: str, tables: list) -> list:
+    """
+    I'm returning structure blocks, preferring the single batched catalog query.
+    If the account can't read information_schema (restricted grants), I fall back
+    to DESCRIBE per table, run in parallel so I wait for the slowest table rather
+    than the sum of all of them.
+    """
+    from mysql.connector import Error as MySQLError
+    from app.core.db_bootstrap import get_connection_pool
+    
+    try:
+        blocks = describe_tables_from_catalog(db_name)
+        if blocks:
+            return blocks
+    except MySQLError:
+        pass
+    
+    def describe_if_present(table: str):
+        # A missing table is reported as (MISSING) by find_tables, so I just leave out its block
+        try:
+            return describe_table(db_name, table)
+        except MySQLError:
+            return None
+    
+    # Leaving one pooled connection free for a catalog query that may still be running,
+    # since mysql.connector raises instead of waiting when the pool is empty
+    workers = max(1, min(8, get_connection_pool().pool_size - 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [block for block in executor.map(describe_if_present, tables) if block is not None]
+
+def inspect_database(db_name: str, expected: list):
+    """
+    I'm running my two catalog queries at the same time on separate pooled connections.
+    They don't depend on each other, so I only wait for the slower one.
+    Returns (found_tables, structure_blocks).
+    """
+    from app.core.db_bootstrap import get_connection_pool
+    
+    # mysql.connector raises instead of waiting when the pool is empty,
+    # so with a single pooled connection one worker runs them one after the other
+    workers = 2 if get_connection_pool().pool_size >= 2 else 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        found = executor.submit(find_tables, db_name, expected)
+        structure = executor.submit(describe_tables, db_name, expected)
+        return found.result(), structure.result()
 
 def init_database():
     """
     I'm creating all the tables in my database based on the models I've defined.
     This will only create tables that don't exist yet.
+    It's safe to run on every deploy - once it succeeds, later runs return
+    immediately until the models or the target database change.
     """
+    settings = get_settings()
+    fingerprint = schema_fingerprint(settings)
+    if MARKER_FILE.exists() and MARKER_FILE.read_text(errors="ignore") == fingerprint:
+        print("Database is already initialized for the current models - skipping.")
+        return True
+    
+    # Importing the engine, models and MySQL driver here so importing this
+    # module stays cheap - they're only needed once I actually initialize
+    from app.core.database import engine, Base
+    from app.core.db_bootstrap import ensure_database
+    from app.models.models import User, Expense, Budget  # Importing my models to register them
     
     print("Starting database initialization...")
     
     try:
-        # First, I'll make sure the database exists
-        connection = mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD')
-        )
-        cursor = connection.cursor()
-        
-        # Creating database if it doesn't exist
-        db_name = os.getenv('DB_NAME', 'finance_tracker')
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
+        # Creating database if it doesn't exist (shared with create_database.py)
+        db_name = settings.DB_NAME
+        created = ensure_database(db_name)
         print(f"Database '{db_name}' is ready")
         
-        cursor.close()
-        connection.close()
-        
         # Now I'll create all tables using SQLAlchemy
+        # A database I just created is empty, so there's no point probing for each
+        # table before creating it - I only check first when it already existed
+        # Running every CREATE TABLE on one connection with unique/foreign key checks
+        # off, then switching them back on before the connection returns to the pool
         print("Creating tables...")
-        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("SET unique_checks=0")
+            conn.exec_driver_sql("SET foreign_key_checks=0")
+            try:
+                Base.metadata.create_all(bind=conn, checkfirst=not created)
+            finally:
+                conn.exec_driver_sql("SET foreign_key_checks=1")
+                conn.exec_driver_sql("SET unique_checks=1")
         print("All tables created successfully!")
         
-        # Let me check what tables were created
-        connection = mysql.connector.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            password=os.getenv('DB_PASSWORD'),
-            database=db_name
-        )
-        cursor = connection.cursor()
+        # Let me check that my model tables were created, and collect their structure
+        expected = [User.__tablename__, Expense.__tablename__, Budget.__tablename__]
+        found, structure = inspect_database(db_name, expected)
         
-        cursor.execute("SHOW TABLES")
-        tables = cursor.fetchall()
+        # Building the report first and writing it once instead of one print per line
+        lines = ["\nTables in database:"]
+        lines.extend(f"  - {table}" if table in found else f"  - {table} (MISSING)" for table in expected)
+        sys.stdout.write("\n".join(lines) + "\n")
         
-        print("\nTables in database:")
-        for table in tables:
-            print(f"  - {table[0]}")
+        missing = [table for table in expected if table not in found]
+        if missing:
+            print(f"Error initializing database: tables were not created: {', '.join(missing)}")
+            return False
             
-        # I'll also show the structure of each table
-        for table in tables:
-            print(f"\nStructure of {table[0]}:")
-            cursor.execute(f"DESCRIBE {table[0]}")
-            columns = cursor.fetchall()
-            for column in columns:
-                print(f"  - {column[0]}: {column[1]}")
+        # I'll also show the structure of each table - one write per table, not per column
+        for block in structure:
+            sys.stdout.write(block)
         
-        cursor.close()
-        connection.close()
+        # Remembering this run so the next one can skip straight to done
+        MARKER_FILE.write_text(fingerprint)
         
         return True
         
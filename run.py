@@ -1,18 +1,33 @@
-import uvicorn
-import os
-from dotenv import load_dotenv
-
-# Loading environment variables
-load_dotenv()
+from app.core.config import get_settings
 
 if __name__ == "__main__":
-    # Getting port from environment or using default
-    port = int(os.getenv("PORT", 8000))
+    # Importing uvicorn only when I'm actually starting the server
+    import uvicorn
+    
+    settings = get_settings()
+    
+    # Getting port from my settings (PORT in the environment, 8000 by default)
+    port = settings.PORT
+    
+    # Auto-reload is for development only - it forces a single worker
+    reload = settings.ENV == "dev"
     
-    # Running the application
-    uvicorn.run(
-        "app.main:app",  # Path to my FastAPI app
-        host="0.0.0.0",  # Listen on all interfaces
-        port=port,       # Port number
-        reload=True      # Auto-reload on code changes (development only)
-    )
\ No newline at end of file
+    if reload:
+        # Running the application with the file watcher
+        uvicorn.run(
+            "app.main:app",  # Path to my FastAPI app
+            host="0.0.0.0",  # Listen on all interfaces
+            port=port,       # Port number
+            reload=True      # Auto-reload on code changes
+        )
+    else:
+        # Running one worker per CPU with the fastest available event loop and HTTP parser
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=port,
+            workers=settings.WEB_CONCURRENCY,  # Defaults to the CPU count
+            loop="auto",  # uvloop where it is installed, asyncio on Windows
+            http="httptools",
+            log_level="warning"
+        )
@@ -0,0 +1,33 @@
+"""
+I'm freezing my .env file into app/core/env_generated.py at deploy time.
+Importing that module (served from Python's bytecode cache) is cheaper than
+parsing .env on every start. Re-run this whenever .env changes:
+
+    python tools/freeze_env.py
+
+The generated file holds secrets, so it's git-ignored - never commit it.
+"""
+from pathlib import Path
+from pprint import pformat
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV_FILE = ROOT / ".env"
+OUTPUT_FILE = ROOT / "app" / "core" / "env_generated.py"
+
+def freeze_env(env_file: Path = ENV_FILE, output_file: Path = OUTPUT_FILE) -> int:
+    """
+    I'm writing every key=value pair from env_file into output_file as an ENV dict.
+    Returns how many values were frozen.
+    """
+    # Keys declared without a value come back as None - I skip those
+    values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    output_file.write_text(
+        "# Generated by tools/freeze_env.py from .env - do not edit or commit\n"
+        f"ENV = {pformat(values)}\n"
+    )
+    return len(values)
+
+if __name__ == "__main__":
+    count = freeze_env()
+    print(f"Froze {count} values from {ENV_FILE.name} into {OUTPUT_FILE.relative_to(ROOT)}")
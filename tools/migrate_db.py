@@ -0,0 +1,139 @@
+"""
+I'm bringing a database created by an older version up to date with my models.
+create_all only creates missing tables, so existing tables need these steps:
+- expenses.category / budgets.category were ENUM('FOOD', 'TRANSPORT', ...) holding
+  the enum *names*; my models now store the lowercase values in a VARCHAR(20)
+  with a CHECK constraint, so old rows would fail validation without this
+- the composite indexes on expenses only exist on tables created after they were added
+- users.is_active was a nullable INTEGER with no database default, so older
+  rows can hold NULL; my models expect a non-null TINYINT(1) defaulting to 1
+
+Run it once after upgrading:
+
+    python tools/migrate_db.py
+
+It's safe to re-run - every step checks whether it's still needed.
+"""
+from pathlib import Path
+import sys
+
+# Making the app package importable when run as a script from anywhere
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.models.models import CATEGORY_CHECK, Budget, Expense, User
+
+# Each table with a category column, and the CHECK constraint my models declare for it
+CATEGORY_TABLES = [
+    (Expense.__tablename__, "ck_expenses_category"),
+    (Budget.__tablename__, "ck_budgets_category"),
+]
+
+# The indexes declared next to my Expense model, as CREATE INDEX column lists
+EXPENSE_INDEXES = [
+    ("ix_expenses_user_date", "user_id, date DESC"),
+    ("ix_expenses_user_cat_date", "user_id, category, date"),
+]
+
+def migrate_categories(conn) -> None:
+    """
+    I'm converting each category column in three steps:
+    ENUM -> VARCHAR(20), uppercase names -> lowercase values, then the CHECK constraint.
+    """
+    for table, constraint in CATEGORY_TABLES:
+        data_type = conn.execute(
+            text(
+                "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = 'category'"
+            ),
+            {"table": table}
+        ).scalar()
+        if data_type is None:
+            print(f"  - {table}: no category column, skipping")
+            continue
+        
+        # Changing the type first - MySQL keeps the stored 'FOOD' strings as they are
+        if data_type == "enum":
+            conn.exec_driver_sql(f"ALTER TABLE {table} MODIFY category VARCHAR(20) NOT NULL")
+            print(f"  - {table}: category is now VARCHAR(20)")
+        
+        # Comparing as binary because the default collation treats 'FOOD' and 'food' as equal
+        updated = conn.exec_driver_sql(
+            f"UPDATE {table} SET category = LOWER(category) "
+            "WHERE CAST(category AS BINARY) <> CAST(LOWER(category) AS BINARY)"
+        ).rowcount
+        print(f"  - {table}: lowercased {updated} categories")
+        
+        exists = conn.execute(
+            text(
+                "SELECT 1 FROM information_schema.TABLE_CONSTRAINTS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND CONSTRAINT_NAME = :name"
+            ),
+            {"table": table, "name": constraint}
+        ).first()
+        if exists is None:
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD CONSTRAINT {constraint} CHECK ({CATEGORY_CHECK})")
+            print(f"  - {table}: added {constraint}")
+
+def migrate_expense_indexes(conn) -> None:
+    """
+    I'm adding the composite expense indexes that are missing.
+    ALGORITHM=INPLACE, LOCK=NONE builds them without blocking reads or writes.
+    """
+    table = Expense.__tablename__
+    table_exists = conn.execute(
+        text(
+            "SELECT 1 FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+        ),
+        {"table": table}
+    ).first()
+    if table_exists is None:
+        print(f"  - {table}: table doesn't exist yet, skipping indexes")
+        return
+    
+    for name, columns in EXPENSE_INDEXES:
+        exists = conn.execute(
+            text(
+                "SELECT 1 FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND INDEX_NAME = :name LIMIT 1"
+            ),
+            {"table": table, "name": name}
+        ).first()
+        if exists is None:
+            conn.exec_driver_sql(f"CREATE INDEX {name} ON {table} ({columns}) ALGORITHM=INPLACE LOCK=NONE")
+            print(f"  - {table}: added {name}")
+
+def migrate_user_active_flag(conn) -> None:
+    """
+    I'm filling NULL is_active values, then making the column match my model.
+    """
+    table = User.__tablename__
+    column = conn.execute(
+        text(
+            "SELECT COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = 'is_active'"
+        ),
+        {"table": table}
+    ).first()
+    if column is None:
+        print(f"  - {table}: no is_active column, skipping")
+        return
+    
+    updated = conn.exec_driver_sql(f"UPDATE {table} SET is_active = 1 WHERE is_active IS NULL").rowcount
+    print(f"  - {table}: activated {updated} users with no is_active value")
+    
+    if (column.COLUMN_TYPE, column.IS_NULLABLE, column.COLUMN_DEFAULT) != ("tinyint(1)", "NO", "1"):
+        conn.exec_driver_sql(f"ALTER TABLE {table} MODIFY is_active TINYINT(1) NOT NULL DEFAULT 1")
+        print(f"  - {table}: is_active is now TINYINT(1) NOT NULL DEFAULT 1")
+
+if __name__ == "__main__":
+    print("Migrating database...")
+    with engine.begin() as conn:
+        migrate_categories(conn)
+        migrate_expense_indexes(conn)
+        migrate_user_active_flag(conn)
+    print("Database migration complete!")